@@ -1,3 +1,6 @@
+from collections import deque
+from types import MappingProxyType
+
 from PyQt6.QtCore import Qt
 
 from confumo import Confumo
@@ -7,6 +10,28 @@ LOG_FILE_NAME = f'{LOGGER_NAME}.log'
 APP_NAME = LOGGER_NAME
 LOG_LEVEL = "INFO"
 
+# Built once and shared read-only; UIConfiguration exposes it under the same name
+ALIGNMENT_NAMES_REVERSE_LOOKUP = MappingProxyType({
+    Qt.AlignmentFlag.AlignCenter: 'ALIGN_CENTER',
+    Qt.AlignmentFlag.AlignLeft: 'ALIGN_LEFT',
+    Qt.AlignmentFlag.AlignRight: 'ALIGN_RIGHT',
+    Qt.AlignmentFlag.AlignTop: 'ALIGN_TOP',
+    Qt.AlignmentFlag.AlignBottom: 'ALIGN_BOTTOM',
+    Qt.AlignmentFlag.AlignVCenter: 'ALIGN_VCENTER',
+    Qt.AlignmentFlag.AlignHCenter: 'ALIGN_HCENTER',
+    Qt.AlignmentFlag.AlignJustify: 'ALIGN_JUSTIFY',
+    Qt.AlignmentFlag.AlignAbsolute: 'ALIGN_ABSOLUTE',
+    Qt.AlignmentFlag.AlignLeading: 'ALIGN_LEADING',
+    Qt.AlignmentFlag.AlignTrailing: 'ALIGN_TRAILING',
+    Qt.AlignmentFlag.AlignHorizontal_Mask: 'ALIGN_HORZ_MASK',
+    Qt.AlignmentFlag.AlignVertical_Mask: 'ALIGN_VERT_MASK',
+})
+
+# Same names keyed by the members' identity. Enum members are singletons (Qt.AlignmentFlag(1) and
+# AlignLeading both are AlignLeft), so id() finds them without converting or hashing the flag.
+_ALIGNMENT_NAMES_BY_ID = MappingProxyType(
+    {id(flag): name for flag, name in ALIGNMENT_NAMES_REVERSE_LOOKUP.items()})
+
 
 class UIConfiguration(Confumo):
     """Subclass of BaseConfiguration that handles all UI-related configuration."""
@@ -26,20 +51,14 @@ class UIConfiguration(Confumo):
     ALIGN_HORZ_MASK = Qt.AlignmentFlag.AlignHorizontal_Mask
     ALIGN_VERT_MASK = Qt.AlignmentFlag.AlignVertical_Mask
 
-    ALIGNMENT_NAMES_REVERSE_LOOKUP = {
-        Qt.AlignmentFlag.AlignCenter: 'ALIGN_CENTER',
-        Qt.AlignmentFlag.AlignLeft: 'ALIGN_LEFT',
-        Qt.AlignmentFlag.AlignRight: 'ALIGN_RIGHT',
-        Qt.AlignmentFlag.AlignTop: 'ALIGN_TOP',
-        Qt.AlignmentFlag.AlignBottom: 'ALIGN_BOTTOM',
-        Qt.AlignmentFlag.AlignVCenter: 'ALIGN_VCENTER',
-        Qt.AlignmentFlag.AlignHCenter: 'ALIGN_HCENTER',
-        Qt.AlignmentFlag.AlignJustify: 'ALIGN_JUSTIFY',
-        Qt.AlignmentFlag.AlignAbsolute: 'ALIGN_ABSOLUTE',
-        Qt.AlignmentFlag.AlignLeading: 'ALIGN_LEADING',
-        Qt.AlignmentFlag.AlignTrailing: 'ALIGN_TRAILING',
-        Qt.AlignmentFlag.AlignHorizontal_Mask: 'ALIGN_HORZ_MASK',
-        Qt.AlignmentFlag.AlignVertical_Mask: 'ALIGN_VERT_MASK',
+    ALIGNMENT_NAMES_REVERSE_LOOKUP = ALIGNMENT_NAMES_REVERSE_LOOKUP
+
+    # Template for the sections every configuration starts with
+    _DEFAULT_SECTIONS = {
+        "main_content": {
+            "text": "Main Content",
+            "alignment": ALIGN_CENTER
+        }
     }
 
     def __init__(self, app_name=APP_NAME, additional_args=None):
@@ -57,12 +76,8 @@ class UIConfiguration(Confumo):
         self.window_size = (640, 480)
         self.window_position = (100, 100)
         self.enable_status_bar_manager = False
-        self.collapsible_sections = {
-            "main_content": {
-                "text": "Main Content",
-                "alignment": Qt.AlignmentFlag.AlignCenter
-            }
-        }
+        # Sections are edited in place by the layout code, so each instance gets its own inner dicts
+        self.collapsible_sections = {name: dict(section) for name, section in self._DEFAULT_SECTIONS.items()}
 
     def initialize(self):
         """Call this method when you need to explicitly initialize glavnaqt."""
@@ -73,7 +88,8 @@ class UIConfiguration(Confumo):
         """
         Returns the custom widget for the given section, if any.
         """
-        return self.collapsible_sections.get(section_name, {}).get("widget")
+        section = self.collapsible_sections.get(section_name)
+        return section.get("widget") if section is not None else None
 
     def update_collapsible_section(self, section_name, text=None, alignment=Qt.AlignmentFlag.AlignCenter, widget=None,
                                    status_label=None):
@@ -86,37 +102,95 @@ class UIConfiguration(Confumo):
             self.collapsible_sections[section_name].update({"status_label": status_label})
 
     def get_section_alignment(self, section_name):
-        return self.collapsible_sections.get(section_name, {}).get("alignment", Qt.AlignmentFlag.AlignCenter)
+        section = self.collapsible_sections.get(section_name)
+        if section is None:
+            return Qt.AlignmentFlag.AlignCenter
+        return section.get("alignment", Qt.AlignmentFlag.AlignCenter)
 
     def replace_alignment_constants(self, data=None):
-        """Recursively replaces alignment objects with their constant var names."""
+        """
+        Replaces alignment objects with their constant var names. Without data, formats collapsible_sections.
+        """
         if data is None:
             data = self.collapsible_sections
+        return self._format_alignment_constants(data)
 
-        def replace_and_format(d):
-            if isinstance(d, dict):
-                return '{' + ', '.join(f'{repr(key)}: {replace_and_format(value)}' for key, value in d.items()) + '}'
-            elif isinstance(d, tuple):
-                return f'({", ".join(map(replace_and_format, d))})'
-            elif isinstance(d, Qt.AlignmentFlag):
-                return self.ALIGNMENT_NAMES_REVERSE_LOOKUP[d]
+    def _format_alignment_constants(self, data):
+        """
+        Nested dicts and tuples are walked in post-order with an explicit stack instead of recursion: a
+        container is pushed once to expand its children and once more, beneath them, to be formatted after
+        all of them, so it only joins the already formatted strings of its children. Subtrees shared between
+        sections are formatted a single time.
+        """
+        alignment_names = _ALIGNMENT_NAMES_BY_ID
+        alignment_flag = Qt.AlignmentFlag
+        formatted = {}
+
+        # Containers are matched with isinstance so dict and tuple subclasses are walked too; the enum
+        # can't be subclassed, an exact type check is enough for it.
+        def format_value(d):
+            if isinstance(d, (dict, tuple)):
+                return formatted[id(d)]
+            elif type(d) is alignment_flag:
+                name = alignment_names.get(id(d))
+                return name if name is not None else repr(d)  # combined flags have no constant name
+            return repr(d)
+
+        expanded = set()
+        stack = deque([(data, False)] if isinstance(data, (dict, tuple)) else ())
+        while stack:
+            node, children_done = stack.pop()
+            if not children_done:
+                if id(node) in expanded:  # a shared container, reached again from another parent
+                    continue
+                expanded.add(id(node))
+                stack.append((node, True))
+                for child in (node.values() if isinstance(node, dict) else node):
+                    if isinstance(child, (dict, tuple)) and id(child) not in expanded:
+                        stack.append((child, False))
+                continue
+
+            # Each container's tokens go into one list that is joined once, rather than formatting every
+            # entry into its own string and concatenating brackets around the joined result.
+            if isinstance(node, dict):
+                parts = ['{']
+                for key, value in node.items():
+                    parts += (repr(key), ': ', format_value(value), ', ')
+                closing = '}'
             else:
-                return repr(d)
+                parts = ['(']
+                for value in node:
+                    parts += (format_value(value), ', ')
+                closing = ')'
+            if len(parts) > 1:
+                parts[-1] = closing  # replaces the trailing separator
+            else:
+                parts.append(closing)
+            formatted[id(node)] = ''.join(parts)
+
+        return format_value(data)
 
-        return replace_and_format(data)
+    # repr() is hit implicitly by logging and error paths; keep it cheap and format on request
+    __repr__ = object.__repr__
 
-    def __repr__(self):
+    def debug_repr(self):
+        """
+        Returns the formatted configuration. Only debug paths ask for it, so it is formatted on every call;
+        the sections can be edited in place, which a cached string would not notice.
+        """
         return f"UIConfigurationSingleton({self.replace_alignment_constants()})"
 
+    def _state(self):
+        """
+        Returns the settings that define this configuration as a single tuple, cheapest ones first.
+        """
+        return (self.font_face, self.font_size, self.splitter_handle_width, self.window_size,
+                self.window_position, self.enable_status_bar_manager, self.collapsible_sections)
+
     def __eq__(self, other):
         if not isinstance(other, UIConfiguration):
             return False
-        return (self.font_face == other.font_face and
-                self.font_size == other.font_size and
-                self.splitter_handle_width == other.splitter_handle_width and
-                self.window_size == other.window_size and
-                self.window_position == other.window_position and
-                self.enable_status_bar_manager == other.enable_status_bar_manager and
-                self.collapsible_sections == other.collapsible_sections)
-
-UIConfiguration.get_instance()
\ No newline at end of file
+        return self._state() == other._state()
+
+
+UIConfiguration.get_instance()
@@ -1,19 +1,28 @@
+_ALL_CONFIGURATIONS = (
+    (),
+    ("left",),
+    ("right",),
+    ("top",),
+    ("bottom",),
+    ("left", "right"),
+    ("left", "top"),
+    ("left", "bottom"),
+    ("right", "top"),
+    ("right", "bottom"),
+    ("top", "bottom"),
+    ("left", "right", "top"),
+    ("left", "right", "bottom"),
+    ("left", "top", "bottom"),
+    ("right", "top", "bottom"),
+    ("left", "right", "top", "bottom"),
+)
+
+
 def all_configurations():
-    return [
-        [],
-        ["left"],
-        ["right"],
-        ["top"],
-        ["bottom"],
-        ["left", "right"],
-        ["left", "top"],
-        ["left", "bottom"],
-        ["right", "top"],
-        ["right", "bottom"],
-        ["top", "bottom"],
-        ["left", "right", "top"],
-        ["left", "right", "bottom"],
-        ["left", "top", "bottom"],
-        ["right", "top", "bottom"],
-        ["left", "right", "top", "bottom"]
-    ]
+    """
+    Returns every combination of collapsible sections around the main content.
+
+    The combinations are built once at import time and shared between callers,
+    so they are immutable tuples rather than lists.
+    """
+    return _ALL_CONFIGURATIONS
@@ -1,29 +1,41 @@
 class EventBus:
+    __slots__ = ("listeners",)
+
     def __init__(self):
+        # Callbacks are kept in tuples that are replaced, never mutated, on (un)subscribe. emit() can
+        # then iterate them without copying while callbacks unsubscribe themselves.
         self.listeners = {}
 
     def subscribe(self, event_type, callback):
         """Subscribe to an event with a specific callback."""
-        if event_type not in self.listeners:
-            self.listeners[event_type] = []
-        self.listeners[event_type].append(callback)
+        self.listeners[event_type] = self.listeners.get(event_type, ()) + (callback,)
 
     def emit(self, event_type, *args, **kwargs):
         """Emit an event and call all registered callbacks for that event type."""
-        if event_type in self.listeners:
-            for callback in self.listeners[event_type]:
+        callbacks = self.listeners.get(event_type)
+        if not callbacks:
+            return
+        if kwargs:
+            for callback in callbacks:
                 callback(*args, **kwargs)
+        else:
+            # Most events carry no keyword arguments; skip the **kwargs unpacking for them
+            for callback in callbacks:
+                callback(*args)
 
     def unsubscribe(self, event_type, callback):
         """Unsubscribe a specific callback from an event."""
-        if event_type in self.listeners:
-            try:
-                self.listeners[event_type].remove(callback)
-                if not self.listeners[event_type]:  # Clean up if no listeners are left
-                    del self.listeners[event_type]
-            except ValueError:
-                # If callback is not found, ignore
-                pass
+        callbacks = self.listeners.get(event_type, ())
+        try:
+            index = callbacks.index(callback)
+        except ValueError:
+            # If callback is not found, ignore
+            return
+        remaining = callbacks[:index] + callbacks[index + 1:]
+        if remaining:
+            self.listeners[event_type] = remaining
+        else:  # Clean up if no listeners are left
+            del self.listeners[event_type]
 
 
 # Dictionary to store shared EventBus instances
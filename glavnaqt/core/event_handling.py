@@ -27,34 +27,25 @@ def setup_event_handling(main_window, resize_signal):
     main_window.resize_timer.setSingleShot(True)
     main_window.resize_timer.timeout.connect(lambda: main_window.resize_signal.resized.emit())
 
+    # Started on the first event of a resize burst and not restarted by the ones after it, so a long
+    # continuous drag still adjusts the layout periodically instead of only once it stops
+    main_window.resize_max_timer = QTimer()
+    main_window.resize_max_timer.setSingleShot(True)
+    main_window.resize_max_timer.timeout.connect(lambda: main_window.resize_signal.resized.emit())
+
     logger.debug("Resize signal connected and ready to emit on resize event.")
 
 
 def handle_resize_event(main_window, event):
     """
-    Handles the window resize event, managing the suppression of logging and controlling the resize timer.
+    Handles the window resize event by (re)starting the debounce timer, so the resized signal fires once
+    the window has stopped changing size, or at the latest 200 ms into a burst of resize events.
 
     Args:
         main_window (QMainWindow): The main window instance receiving the resize event.
         event (QResizeEvent): The resize event to handle.
     """
-    if not hasattr(main_window, 'suppress_logging'):
-        main_window.suppress_logging = False
-
-    if main_window.suppress_logging:
-        # Stop and restart the timer for real-time updates if logging is suppressed
-        if main_window.resize_timer.isActive():
-            main_window.resize_timer.stop()
-        main_window.resize_timer.start(50)  # Reduced delay for faster response
-    else:
-        logger.debug("Entered handle_resize_event.")
-        main_window.resize_signal.resized.emit()
-
-        if main_window.resize_timer.isActive():
-            logger.debug("Stopping active resize timer.")
-            main_window.resize_timer.stop()
-
-        logger.debug("Starting resize signal timer.")
-        main_window.resize_timer.start(50)  # Reduced delay for faster response
-
-        logger.debug("Exiting handle_resize_event.")
+    # start() on an active single-shot timer restarts it, no need to stop it first
+    main_window.resize_timer.start(50)  # Reduced delay for faster response
+    if not main_window.resize_max_timer.isActive():
+        main_window.resize_max_timer.start(200)
@@ -51,10 +51,11 @@ def configure_logger(logger, module_name):
     logger.info(f"Logger configured for module: {module_name}")
 
 
-# Expose logger dynamically based on module
+# Expose the module logger's methods (logger.debug, logger.isEnabledFor, ...) on the module itself.
+# Resolving through get_dynamic_logger() here always landed on this module's logger anyway, since the
+# calling frame is this function, but paid for a full inspect.stack() on every log call.
 def __getattr__(name):
-    dynamic_logger = get_dynamic_logger()
-    return getattr(dynamic_logger, name)
+    return getattr(logger, name)
 
 
 # Ensure the main module logger is set up
@@ -1,7 +1,20 @@
+import logging
+from functools import lru_cache
+
 from glavnaqt.core import logger
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QWidget, QSplitter, QLabel
 
+# Flags reported by alignment_to_string, in output order, resolved to ints once at import
+_ALIGNMENT_FLAG_NAMES = (
+    (int(Qt.AlignmentFlag.AlignLeft), "AlignLeft"),
+    (int(Qt.AlignmentFlag.AlignRight), "AlignRight"),
+    (int(Qt.AlignmentFlag.AlignHCenter), "AlignHCenter"),
+    (int(Qt.AlignmentFlag.AlignTop), "AlignTop"),
+    (int(Qt.AlignmentFlag.AlignBottom), "AlignBottom"),
+    (int(Qt.AlignmentFlag.AlignVCenter), "AlignVCenter"),
+    (int(Qt.AlignmentFlag.AlignCenter), "AlignCenter"),
+)
 
 
 def log_widget_hierarchy(widget, level=0, visited=None, visual_mapping=True):
@@ -12,111 +25,118 @@ def log_widget_hierarchy(widget, level=0, visited=None, visual_mapping=True):
     Args:
         widget (QWidget): The root widget to start logging from.
         level (int, optional): The indentation level for nested widgets. Defaults to 0.
-        visited (set, optional): Set of widget IDs that have already been logged. Defaults to None.
+        visited (set, optional): Set of widget IDs that have already been logged; widgets logged by this call are
+            added to it. Defaults to None, which skips the bookkeeping: every widget is reached through its
+            parent's layout or as a direct child, so a single walk never meets a widget twice.
         visual_mapping (bool, optional): Whether to log the hierarchy in a visual mapping format. Defaults to False.
     """
-    if visited is None:
-        visited = set()
-
-    widget_id = id(widget)
-
-    if widget_id in visited:
-        return  # Skip already logged widgets
-
-    visited.add(widget_id)
-
-    indent = "    " * level
-
-    # Determine visibility status
-    visibility_status = "Visible" if widget.isVisible() else "Hidden"
-
-    if visual_mapping:
-        # If visual mapping is enabled, log hierarchy in a tree-like structure with minimal info and visibility
-        logger.debug(f"{indent}{'|   ' * (level-1)}{'└── ' if level > 0 else ''}{widget.objectName() or 'Unnamed'} "
-                     f"(ID: {hex(widget_id)}) [{visibility_status}]")
-    else:
-        # Log detailed widget information
-        width = widget.geometry().width()
-        height = widget.geometry().height()
-        size_policy = widget.sizePolicy()
-        size_hint = widget.sizeHint()
-
-        logger.debug(f"{indent}Widget: {widget.objectName() or 'Unnamed'}, Type: {type(widget).__name__}, "
-                     f"Width: {width}px, Height: {height}px, ID: {hex(widget_id)}, Visibility: {visibility_status}")
-        logger.debug(f"{indent}    SizePolicy: Horizontal: {size_policy.horizontalPolicy()}, "
-                     f"Vertical: {size_policy.verticalPolicy()}")
-        logger.debug(f"{indent}    SizeHint: {size_hint.width()}px x {size_hint.height()}px")
-
-        # Log margins if available
-        if hasattr(widget, 'getContentsMargins'):
-            left_margin, top_margin, right_margin, bottom_margin = widget.getContentsMargins()
-            logger.debug(f"{indent}    Margins: Left: {left_margin}px, Right: {right_margin}px, "
-                         f"Top: {top_margin}px, Bottom: {bottom_margin}px")
+    # The walk only produces log records; skip the Qt queries for every widget when they'd be dropped
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+
+    # Depth-first walk with an explicit stack instead of recursion
+    stack = [(widget, level)]
+    while stack:
+        widget, level = stack.pop()
+        widget_id = id(widget)
+
+        if visited is not None:
+            if widget_id in visited:
+                continue  # Skip already logged widgets
+            visited.add(widget_id)
+
+        indent, branch = _indent(level)
+
+        # Determine visibility status
+        visibility_status = "Visible" if widget.isVisible() else "Hidden"
+        layout = widget.layout()
+
+        if visual_mapping:
+            # If visual mapping is enabled, log hierarchy in a tree-like structure with minimal info and visibility
+            logger.debug("%s%s%s%s (ID: %#x) [%s]", indent, branch, '└── ' if level > 0 else '',
+                         widget.objectName() or 'Unnamed', widget_id, visibility_status)
         else:
-            logger.debug(f"{indent}    Margins: Not available for {type(widget).__name__}")
-
-        # Log padding using Qt's layout method, if widget has a layout
-        if widget.layout() is not None:
-            layout = widget.layout()
-            margins = layout.contentsMargins()
-            logger.debug(f"{indent}    Layout Padding: Left: {margins.left()}px, Right: {margins.right()}px, "
-                         f"Top: {margins.top()}px, Bottom: {margins.bottom()}px")
+            # Log detailed widget information
+            geometry = widget.geometry()
+            width = geometry.width()
+            height = geometry.height()
+            size_policy = widget.sizePolicy()
+            size_hint = widget.sizeHint()
+
+            logger.debug("%sWidget: %s, Type: %s, Width: %dpx, Height: %dpx, ID: %#x, Visibility: %s", indent,
+                         widget.objectName() or 'Unnamed', type(widget).__name__, width, height, widget_id,
+                         visibility_status)
+            logger.debug("%s    SizePolicy: Horizontal: %s, Vertical: %s", indent, size_policy.horizontalPolicy(),
+                         size_policy.verticalPolicy())
+            logger.debug("%s    SizeHint: %dpx x %dpx", indent, size_hint.width(), size_hint.height())
+
+            # Log margins if available
+            if hasattr(widget, 'getContentsMargins'):
+                left_margin, top_margin, right_margin, bottom_margin = widget.getContentsMargins()
+                logger.debug("%s    Margins: Left: %dpx, Right: %dpx, Top: %dpx, Bottom: %dpx", indent, left_margin,
+                             right_margin, top_margin, bottom_margin)
+            else:
+                logger.debug("%s    Margins: Not available for %s", indent, type(widget).__name__)
+
+            # Log padding using Qt's layout method, if widget has a layout. The margins are read once and reused
+            # for the layout line below.
+            if layout is not None:
+                margins = layout.contentsMargins()
+                logger.debug("%s    Layout Padding: Left: %dpx, Right: %dpx, Top: %dpx, Bottom: %dpx", indent,
+                             margins.left(), margins.right(), margins.top(), margins.bottom())
+            else:
+                logger.debug("%s    Padding: Not available for %s", indent, type(widget).__name__)
+
+            # Check for alignment
+            if isinstance(widget, QLabel) or hasattr(widget, 'alignment'):
+                alignment = widget.alignment()
+                alignment_str = alignment_to_string(alignment)
+                logger.debug("%s    Alignment: %s", indent, alignment_str)
+
+            # Log text if widget is a QLabel
+            if isinstance(widget, QLabel):
+                logger.debug("%s    Text: %s", indent, widget.text())
+
+            # Check for layout information
+            if layout is not None:
+                logger.debug("%s    Layout: %s, Spacing: %s, ContentsMargins: Left: %dpx, Right: %dpx, Top: %dpx, "
+                             "Bottom: %dpx", indent, type(layout).__name__, layout.spacing(), margins.left(),
+                             margins.right(), margins.top(), margins.bottom())
+
+            # Check for splitters
+            if isinstance(widget, QSplitter):
+                orientation = "Horizontal" if widget.orientation() == Qt.Orientation.Horizontal else "Vertical"
+                logger.debug("%s    Splitter Orientation: %s", indent, orientation)
+
+        # Queue child widgets in reverse so they are popped, and logged, in the correct order
+        if layout is not None:
+            for i in reversed(range(layout.count())):
+                child = layout.itemAt(i).widget()
+                if child is not None:
+                    stack.append((child, level + 1))
         else:
-            logger.debug(f"{indent}    Padding: Not available for {type(widget).__name__}")
-
-        # Check for alignment
-        if isinstance(widget, QLabel) or hasattr(widget, 'alignment'):
-            alignment = widget.alignment()
-            alignment_str = alignment_to_string(alignment)
-            logger.debug(f"{indent}    Alignment: {alignment_str}")
-
-        # Log text if widget is a QLabel
-        if isinstance(widget, QLabel):
-            logger.debug(f"{indent}    Text: {widget.text()}")
-
-        # Check for layout information
-        if widget.layout() is not None:
-            layout = widget.layout()
-            margins = layout.contentsMargins()
-            logger.debug(f"{indent}    Layout: {type(layout).__name__}, Spacing: {layout.spacing()}, "
-                         f"ContentsMargins: Left: {margins.left()}px, Right: {margins.right()}px, "
-                         f"Top: {margins.top()}px, Bottom: {margins.bottom()}px")
-
-        # Check for splitters
-        if isinstance(widget, QSplitter):
-            orientation = "Horizontal" if widget.orientation() == Qt.Orientation.Horizontal else "Vertical"
-            logger.debug(f"{indent}    Splitter Orientation: {orientation}")
-
-    # Recursively log child widgets in the correct order
-    if widget.layout() is not None:
-        for i in range(widget.layout().count()):
-            child = widget.layout().itemAt(i).widget()
-            if child is not None:
-                log_widget_hierarchy(child, level + 1, visited, visual_mapping)
-    else:
-        for child in widget.findChildren(QWidget):
-            log_widget_hierarchy(child, level + 1, visited, visual_mapping)
+            # Direct children only: the walk reaches grandchildren through them, at their actual depth
+            for child in reversed(widget.findChildren(QWidget, options=Qt.FindChildOption.FindDirectChildrenOnly)):
+                stack.append((child, level + 1))
 
 
+@lru_cache(maxsize=64)
+def _indent(level):
+    """
+    Returns the indent and tree branch prefixes for a depth, built once per depth across all calls.
+    """
+    return "    " * level, "|   " * max(level - 1, 0)
+
 
 def alignment_to_string(alignment):
     """
     Converts the alignment flag to a human-readable string.
     """
-    alignments = []
-    if alignment & Qt.AlignmentFlag.AlignLeft:
-        alignments.append("AlignLeft")
-    if alignment & Qt.AlignmentFlag.AlignRight:
-        alignments.append("AlignRight")
-    if alignment & Qt.AlignmentFlag.AlignHCenter:
-        alignments.append("AlignHCenter")
-    if alignment & Qt.AlignmentFlag.AlignTop:
-        alignments.append("AlignTop")
-    if alignment & Qt.AlignmentFlag.AlignBottom:
-        alignments.append("AlignBottom")
-    if alignment & Qt.AlignmentFlag.AlignVCenter:
-        alignments.append("AlignVCenter")
-    if alignment & Qt.AlignmentFlag.AlignCenter:
-        alignments.append("AlignCenter")
+    return _alignment_value_to_string(int(alignment))
+
 
+@lru_cache(maxsize=64)
+def _alignment_value_to_string(value):
+    # A UI only uses a handful of distinct alignments, so each string is built once
+    alignments = [name for flag, name in _ALIGNMENT_FLAG_NAMES if value & flag]
     return " | ".join(alignments) if alignments else "AlignNone"
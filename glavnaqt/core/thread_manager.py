@@ -1,20 +1,54 @@
 import inspect
-from collections import defaultdict
+import threading
+from functools import lru_cache, partial
 
 from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QMutexLocker, QMutex, QWaitCondition
 
 from glavnaqt.core import logger
 
 
-def log_active_threads() -> None:
+def log_active_threads(thread_pool: QThreadPool = None) -> None:
     """
-    Logs the active thread count in the global QThreadPool instance.
+    Logs the active thread count of a thread pool.
 
+    :param thread_pool: The pool to report on, such as a ThreadManager's thread_pool. Defaults to the global
+        QThreadPool instance.
     :return: None
     """
-    thread_pool = QThreadPool.globalInstance()
+    if thread_pool is None:
+        thread_pool = QThreadPool.globalInstance()
     active_count = thread_pool.activeThreadCount()
-    logger.debug(f"[ThreadManager] Active threads: {active_count}")
+    logger.debug("[ThreadManager] Active threads: %d", active_count)
+
+
+@lru_cache(maxsize=512)
+def _cached_accepts_stop_flag(function: callable) -> bool:
+    return 'stop_flag' in inspect.signature(function).parameters
+
+
+def _accepts_stop_flag(function: callable) -> bool:
+    """
+    Checks whether the function takes a 'stop_flag' argument. Building a signature is costly, so the answer is
+    cached per underlying function; tasks mostly reuse the same few functions. Bound methods and partials are
+    unwrapped first, so the cache never holds on to the instances or arguments they carry.
+
+    :param function: The task function to inspect.
+    :return: True if the function has a 'stop_flag' parameter.
+    """
+    target = function
+    while True:
+        if isinstance(target, partial) and not target.args:
+            target = target.func
+        elif inspect.ismethod(target):
+            target = target.__func__
+        else:
+            break
+    if inspect.isfunction(target):
+        # Neither unwrapping changes whether 'stop_flag' is among the parameters; a partial that binds
+        # positional arguments could consume it, so those are inspected as they are below
+        return _cached_accepts_stop_flag(target)
+    # Other callables, such as instances with __call__, would be kept alive by the cache
+    return 'stop_flag' in inspect.signature(function).parameters
 
 
 class TaskRunnable(QRunnable):
@@ -31,8 +65,7 @@ class TaskRunnable(QRunnable):
     def run(self) -> None:
         try:
             # Check if 'stop_flag' is a valid parameter for the function
-            sig = inspect.signature(self.function)
-            if 'stop_flag' in sig.parameters:
+            if _accepts_stop_flag(self.function):
                 # Pass stop_flag to the function
                 self.function(*self.args, stop_flag=self.stop_flag, **self.kwargs)
             else:
@@ -48,45 +81,112 @@ class TaskRunnable(QRunnable):
                     logger.error(f"[ThreadManager] Error in on_finished callback for tag '{self.tag}': {e}")
 
 
+class _TagCounter:
+    """
+    Active task count for a single tag. Each tag has its own lock, so submitting and finishing tasks only
+    contends with tasks of the same tag; ThreadManager.tag_mutex is left for adding and retiring tags.
+    """
+    __slots__ = ("lock", "count", "retired")
+
+    def __init__(self) -> None:
+        # A plain threading.Lock: acquired in C by the with statement, without a QMutexLocker per use
+        self.lock = threading.Lock()
+        self.count = 0
+        self.retired = False  # Set once the count drops to zero; a retired counter is never reused
+
+
 class ThreadManager(QObject):
 
-    def __init__(self, max_workers: int = 16) -> None:
+    def __init__(self, max_workers: int = 16, use_global_pool: bool = False) -> None:
+        """
+        :param max_workers: The maximum number of threads in the pool. Not applied to the global pool, whose
+            limit belongs to the application.
+        :param use_global_pool: Run tasks on Qt's global thread pool, shared with the rest of the application,
+            instead of a private pool. The manager then neither resizes nor clears that pool.
+        """
         super().__init__()
-        self.thread_pool = QThreadPool()
-        self.thread_pool.setMaxThreadCount(max_workers)
+        self.uses_global_pool = use_global_pool
+        if use_global_pool:
+            self.thread_pool = QThreadPool.globalInstance()
+        else:
+            self.thread_pool = QThreadPool()
+            self.thread_pool.setMaxThreadCount(max_workers)
         self.is_shutting_down = False
         self.is_shutting_down_mutex = QMutex()
-        self.active_tasks_by_tag = defaultdict(int)
-        self.stop_flags_by_tag = defaultdict(lambda: False)  # Stop flags for tasks by tag
+        self.active_tasks_by_tag = {}  # tag -> _TagCounter, added and removed under tag_mutex
+        self.stop_flags_by_tag = {}  # Stop events for tasks by tag, created under tag_mutex
         self.tag_mutex = QMutex()
         self.tag_condition = QWaitCondition()
 
     def submit_task(self, task: callable, *args, tag: str = None, on_finished: callable = None, **kwargs) -> QRunnable:
+        # Only the flag check needs the mutex; submitters don't serialize on building and starting runnables
         with QMutexLocker(self.is_shutting_down_mutex):
-            if self.is_shutting_down:
-                logger.warning("[ThreadManager] Cannot submit new tasks, shutdown in progress.")
-                return None
-
-            try:
-                # Always pass the task, decide later in TaskRunnable whether stop_flag is needed
-                runnable = TaskRunnable(
-                    task,
-                    on_finished=on_finished or self.task_finished_callback,
-                    tag=tag,
-                    stop_flag=lambda: self.stop_flags_by_tag[tag],
-                    *args,
-                    **kwargs
-                )
-
-                if tag:
-                    with QMutexLocker(self.tag_mutex):
-                        self.active_tasks_by_tag[tag] += 1
-
-                self.thread_pool.start(runnable)
-                return runnable
-            except Exception as e:
-                logger.error(f"[ThreadManager] Error submitting task: {e}")
-                return None
+            is_shutting_down = self.is_shutting_down
+        if is_shutting_down:
+            logger.warning("[ThreadManager] Cannot submit new tasks, shutdown in progress.")
+            return None
+
+        try:
+            if tag:
+                self._increment_tag(tag)
+            # Looked up after the tag is counted, so the task shares the event of the tag's current tasks
+            stop_event = self._stop_event(tag)
+            if tag and self.is_shutting_down:
+                # A shutdown that started after the check above may have missed this tag when it sent the stop
+                # signals; the task is still started, but told to stop
+                stop_event.set()
+
+            # Always pass the task, decide later in TaskRunnable whether stop_flag is needed
+            runnable = TaskRunnable(
+                task,
+                on_finished=on_finished or self.task_finished_callback,
+                tag=tag,
+                stop_flag=stop_event.is_set,
+                *args,
+                **kwargs
+            )
+
+            self.thread_pool.start(runnable)
+            return runnable
+        except Exception as e:
+            logger.error(f"[ThreadManager] Error submitting task: {e}")
+            return None
+
+    def _increment_tag(self, tag: str) -> None:
+        """
+        Counts a new task for the tag, registering a counter for it if the tag has no active tasks.
+
+        :param tag: The tag of the submitted task.
+        :return: None
+        """
+        while True:
+            counter = self.active_tasks_by_tag.get(tag)
+            if counter is None or counter.retired:
+                with QMutexLocker(self.tag_mutex):
+                    counter = self.active_tasks_by_tag.get(tag)
+                    if counter is None or counter.retired:
+                        counter = self.active_tasks_by_tag[tag] = _TagCounter()
+                        # The tag's previous tasks may not have cleaned up yet; don't inherit their stop signal
+                        self.stop_flags_by_tag.pop(tag, None)
+            with counter.lock:
+                if not counter.retired:
+                    counter.count += 1
+                    return
+            # The counter was retired between the lookup and the increment, start over with a new one
+
+    def _stop_event(self, tag: str) -> threading.Event:
+        """
+        Returns the stop event shared by the tasks with the given tag, creating it if needed.
+
+        :param tag: The tag of the tasks.
+        :return: The tag's stop event.
+        """
+        stop_event = self.stop_flags_by_tag.get(tag)
+        if stop_event is None:
+            # Created under the mutex so concurrent submitters can't end up with different events
+            with QMutexLocker(self.tag_mutex):
+                stop_event = self.stop_flags_by_tag.setdefault(tag, threading.Event())
+        return stop_event
 
     def stop_tasks_by_tag(self, tag: str) -> None:
         """
@@ -94,24 +194,36 @@ class ThreadManager(QObject):
         """
         with QMutexLocker(self.tag_mutex):
             if tag in self.active_tasks_by_tag:
-                self.stop_flags_by_tag[tag] = True
+                self.stop_flags_by_tag.setdefault(tag, threading.Event()).set()
                 logger.info(f"[ThreadManager] Stop signal sent for tasks with tag '{tag}'")
 
     def reset_stop_flag(self, tag: str) -> None:
         """
         Reset the stop flag for the specified tag.
         """
-        self.stop_flags_by_tag[tag] = False
+        stop_event = self.stop_flags_by_tag.get(tag)
+        if stop_event is not None:  # A tag without an event has nothing to reset
+            stop_event.clear()
 
     def task_finished_callback(self, tag: str) -> None:
-        if tag:
-            with QMutexLocker(self.tag_mutex):
-                if tag in self.active_tasks_by_tag:
-                    self.active_tasks_by_tag[tag] -= 1
-                    if self.active_tasks_by_tag[tag] <= 0:
-                        self.active_tasks_by_tag.pop(tag, None)
-                        self.tag_condition.wakeAll()
-                        self.stop_flags_by_tag.pop(tag, None)  # Clean up stop flag
+        if not tag:
+            return
+        counter = self.active_tasks_by_tag.get(tag)
+        if counter is None:
+            return
+        with counter.lock:
+            if counter.retired:
+                return
+            counter.count -= 1
+            if counter.count > 0:
+                return
+            counter.retired = True
+        # Last task for the tag; only this transition needs the shared mutex
+        with QMutexLocker(self.tag_mutex):
+            if self.active_tasks_by_tag.get(tag) is counter:
+                del self.active_tasks_by_tag[tag]
+                self.tag_condition.wakeAll()
+                self.stop_flags_by_tag.pop(tag, None)  # Clean up stop flag
 
     def wait_for_tagged_tasks(self, tag: str) -> None:
         """
@@ -138,10 +250,21 @@ class ThreadManager(QObject):
         # Signal all running tasks to stop
         with QMutexLocker(self.tag_mutex):
             for tag in self.active_tasks_by_tag:
-                self.stop_flags_by_tag[tag] = True
+                self.stop_flags_by_tag.setdefault(tag, threading.Event()).set()
             logger.info("[ThreadManager] Stop signals sent for all running tasks.")
 
-        # Do not wait for tasks to finish, just signal shutdown
-        self.thread_pool.clear()
+        # Do not wait for tasks to finish, just signal shutdown. Runnables queued on the shared global pool may
+        # belong to other code, so only a private pool is cleared; this manager's queued tasks still start
+        # there, but are told to stop.
+        if not self.uses_global_pool:
+            self.thread_pool.clear()
         logger.info("[ThreadManager] Thread pool shutdown initiated, not waiting for tasks to complete.")
 
+    def log_active_threads(self) -> None:
+        """
+        Logs the active thread count of the manager's thread pool.
+
+        :return: None
+        """
+        log_active_threads(self.thread_pool)
+
@@ -5,59 +5,68 @@ from PyQt6.QtWidgets import QApplication
 
 from glavnaqt.core.config import UIConfiguration
 from glavnaqt.core import logger
-from glavnaqt.core.config_manager import all_configurations
 from glavnaqt.core.thread_manager import ThreadManager
 from glavnaqt.ui.main_window import MainWindow
 from glavnaqt.ui.status_bar_manager import StatusBarManager
-from glavnaqt.ui.transitions import perform_transition
 
 config = UIConfiguration.get_instance()
-def schedule_transition(main_window, config_i, config_j, delay):
-    """Schedules a transition between two configurations with a delay."""
-    QTimer.singleShot(delay, lambda: perform_transition(main_window, config_i, config_j))
+
+# Default configuration with all sections and additional UI properties
+_DEFAULT_SECTIONS = {
+    "top": {"text": "Top Bar", "alignment": UIConfiguration.ALIGN_CENTER},
+    "bottom": {"text": "Status Bar", "alignment": UIConfiguration.ALIGN_CENTER},
+    "left": {"text": "Left Sidebar", "alignment": UIConfiguration.ALIGN_CENTER},
+    "right": {"text": "Right Sidebar", "alignment": UIConfiguration.ALIGN_CENTER},
+    "main_content": {"text": "Main Content", "alignment": UIConfiguration.ALIGN_CENTER}
+}
 
 
 def cycle_configs(main_window, configurations):
     """Cycles through all configurations to apply them to the main window."""
+    # Only needed when cycling is enabled, so the import stays off the default startup path
+    from glavnaqt.ui.transitions import perform_transition
+
     total_configs = len(configurations)
     transition_time = 10000  # 10 seconds total for each transition
-    index = 0
-    cyclequit = False
-    for i in range(total_configs):
-        if cyclequit:
-            break
-        for j in range(total_configs):
-            if i != j:  # Skip self-transitions
-                # Create separate configuration instances
-                config.collapsible_sections = convert_to_dict_config(configurations[i])
-                ui_config_i = config.copy()
-
-                config.collapsible_sections = convert_to_dict_config(configurations[j])
-                ui_config_j = config.copy()
-
-                schedule_transition(main_window, ui_config_i, ui_config_j, index * transition_time)
-                index += 1
-                # if index >= 1:
-                # cyclequit = True
-                # break
+    convert, copy_config = convert_to_dict_config, config.copy
+    # Create one configuration instance per layout up front; transitions only read them, so every pair
+    # can share the same instances instead of rebuilding both for each transition
+    ui_configs = []
+    singleton_sections = config.collapsible_sections
+    for configuration in configurations:
+        config.collapsible_sections = convert(configuration)
+        ui_configs.append(copy_config())
+    # The singleton is only borrowed to produce the snapshots; leave it with the sections it had
+    config.collapsible_sections = singleton_sections
+    transitions = ((ui_configs[i], ui_configs[j])
+                   for i in range(total_configs) for j in range(total_configs)
+                   if i != j)  # Skip self-transitions
+
+    # One repeating timer steps through the transitions, rather than a single-shot timer per pair
+    timer = QTimer(main_window)
+    timer.setInterval(transition_time)
+
+    def next_transition():
+        pair = next(transitions, None)
+        if pair is None:
+            timer.stop()
+            return
+        perform_transition(main_window, *pair)
+
+    timer.timeout.connect(next_transition)
+    timer.start()
+    QTimer.singleShot(0, next_transition)  # The first transition runs as soon as the event loop starts
 
 
 def convert_to_dict_config(config_list):
     """Converts a list of section names into a UI configuration dictionary."""
-    # Default configuration with all sections and additional UI properties
-    default_config = {
-        "top": {"text": "Top Bar", "alignment": config.ALIGN_CENTER},
-        "bottom": {"text": "Status Bar", "alignment": config.ALIGN_CENTER},
-        "left": {"text": "Left Sidebar", "alignment": config.ALIGN_CENTER},
-        "right": {"text": "Right Sidebar", "alignment": config.ALIGN_CENTER},
-        "main_content": {"text": "Main Content", "alignment": config.ALIGN_CENTER}
-    }
-
-    # Filter out sections that are not in the provided config_list
-    filtered_sections = {section: default_config[section] for section in config_list if section in default_config}
-
-    # Always include "main_content"
-    filtered_sections["main_content"] = default_config["main_content"]
+    # Filter out sections that are not in the provided config_list. Walking the defaults pairs each name with
+    # its section in one pass and keeps their order stable. The section dicts are copied, the layout code may
+    # edit a configuration's sections in place.
+    wanted = set(config_list)
+    wanted.add("main_content")  # Always include "main_content"
+    filtered_sections = {section: dict(defaults) for section, defaults in _DEFAULT_SECTIONS.items()
+                         if section in wanted}
 
     return filtered_sections
 
@@ -78,6 +87,7 @@ def main():
 
     if cycle_configs_enabled:
         # If --cycle-configs is provided, cycle through all configurations
+        from glavnaqt.core.config_manager import all_configurations
         configurations = all_configurations()
         cycle_configs(main_window, configurations)
 
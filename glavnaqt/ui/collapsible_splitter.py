@@ -1,7 +1,7 @@
 import logging
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QMouseEvent
-from PyQt6.QtWidgets import QSplitter
+from PyQt6.QtWidgets import QSplitter, QApplication
 from glavnaqt.ui.splitter_handle import CollapsibleSplitterHandle
 from glavnaqt.core import logger
 
@@ -14,6 +14,17 @@ class CollapsibleSplitter(QSplitter):
         identifier (str): A unique identifier for the splitter, used for logging and identifying splitters.
     """
 
+    # Sizes that collapse the section a splitter is identified by
+    _COLLAPSE_SIZES = {
+        "top": (0, 1),
+        "bottom": (1, 0),
+        "left": (0, 1),
+        "right": (1, 0),
+    }
+
+    # Kept on the application stylesheet instead of parsed for every splitter; matched by the class name
+    STYLESHEET = "CollapsibleSplitter { padding: 0px; margin: 0px; }"
+
     def __init__(self, orientation, parent=None, identifier="", handle_width=5):
         """
         Initializes the CollapsibleSplitter with the specified orientation and handle width.
@@ -24,17 +35,29 @@ class CollapsibleSplitter(QSplitter):
             identifier (str, optional): A unique identifier for the splitter. Defaults to an empty string.
             handle_width (int, optional): The width of the splitter handle in pixels. Defaults to 5.
         """
-        logger.debug(f'Initializing CollapsibleSplitter {identifier}')
+        logger.debug('Initializing CollapsibleSplitter %s', identifier)
         super().__init__(orientation, parent)
         self.setHandleWidth(handle_width)
         self.setContentsMargins(0, 0, 0, 0)
-        self.setStyleSheet("padding: 0px; margin: 0px;")
-        #self.setStyleSheet("background-color: transparent; padding: 0px; margin: 0px;")
+        self._install_stylesheet()
         self.splitterMoved.connect(self.on_splitter_moved)
         self.is_collapsed = False
         self.identifier = identifier
-        logger.debug(f'Splitter {identifier} initialized with orientation {orientation}')
-        logger.debug(f'Current stylesheet for {identifier}: {self.styleSheet()}')
+        logger.debug('Splitter %s initialized with orientation %s', identifier, orientation)
+
+    @classmethod
+    def _install_stylesheet(cls):
+        """
+        Appends the splitter rule to the application's stylesheet unless it's already there, keeping whatever
+        stylesheet the application has. Checked for every new splitter, so the rule comes back after the
+        application replaces its stylesheet.
+        """
+        app = QApplication.instance()
+        if app is None:
+            return
+        current = app.styleSheet()
+        if cls.STYLESHEET not in current:
+            app.setStyleSheet(f"{current}\n{cls.STYLESHEET}" if current else cls.STYLESHEET)
 
     def adjust_handle_width(self, scaling_factor):
         """
@@ -44,7 +67,8 @@ class CollapsibleSplitter(QSplitter):
             scaling_factor (float): The factor by which to scale the handle width.
         """
         new_width = max(1, int(5 * scaling_factor))  # Scale from the base width of 5
-        logger.debug(f'Adjusting handle width to {new_width} for {self.identifier}')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Adjusting handle width to %s for %s', new_width, self.identifier)
         self.setHandleWidth(new_width)
 
     def createHandle(self):
@@ -54,7 +78,7 @@ class CollapsibleSplitter(QSplitter):
         Returns:
             CollapsibleSplitterHandle: The custom handle for the splitter.
         """
-        logger.debug(f'Creating custom splitter handle for {self.identifier}')
+        logger.debug('Creating custom splitter handle for %s', self.identifier)
         return CollapsibleSplitterHandle(self.orientation(), self, self.identifier)
 
     def handle_mousePressEvent(self, event: QMouseEvent, handle):
@@ -66,9 +90,12 @@ class CollapsibleSplitter(QSplitter):
             handle (CollapsibleSplitterHandle): The splitter handle that was pressed.
         """
         try:
-            logger.debug(f'Handling mouse press event for {self.identifier}: {event}')
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug('Handling mouse press event for %s: %s', self.identifier, event)
             handle_index = self.indexOf(handle)
-            logger.debug(f'{self.identifier} Handle index: {handle_index}')
+            if debug:
+                logger.debug('%s Handle index: %s', self.identifier, handle_index)
 
             if handle_index == 1 and event.button() == Qt.MouseButton.LeftButton:
                 if not self.is_collapsed:
@@ -82,16 +109,11 @@ class CollapsibleSplitter(QSplitter):
         """
         Collapses the splitter based on its identifier.
         """
-        collapse_sizes = {
-            "top": [0, 1],
-            "bottom": [1, 0],
-            "left": [0, 1],
-            "right": [1, 0],
-        }
-        if self.identifier in collapse_sizes:
-            self.setSizes(collapse_sizes[self.identifier])
+        sizes = self._COLLAPSE_SIZES.get(self.identifier)
+        if sizes is not None:
+            self.setSizes(sizes)
             self.is_collapsed = True
-            logger.debug(f'{self.identifier} collapsed')
+            logger.debug('%s collapsed', self.identifier)
 
     def expand_splitter(self):
         """
@@ -99,7 +121,7 @@ class CollapsibleSplitter(QSplitter):
         """
         self.setSizes([1, 1])
         self.is_collapsed = False
-        logger.debug(f'{self.identifier} expanded')
+        logger.debug('%s expanded', self.identifier)
 
     def on_splitter_moved(self, pos, index):
         """
@@ -109,6 +131,8 @@ class CollapsibleSplitter(QSplitter):
             pos (int): The new position of the splitter.
             index (int): The index of the splitter handle that was moved.
         """
-        logger.debug(f'{self.identifier} Splitter moved to position: {pos} at index: {index}')
+        # Fires for every pixel of a drag
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('%s Splitter moved to position: %s at index: %s', self.identifier, pos, index)
         if self.parent():
             self.parent().adjust_layout()  # Trigger a layout adjustment in the parent (MainWindow)
@@ -1,8 +1,29 @@
+from functools import lru_cache
+
 from PyQt6.QtGui import QFontMetrics, QFont
 
 from glavnaqt.core import logger
 
 
+@lru_cache(maxsize=512)
+def _metrics_for(font_face, pixel_size):
+    """
+    Returns font metrics for the font face at the given pixel size, built once per combination.
+    """
+    font = QFont(font_face)
+    font.setPixelSize(pixel_size)
+    return QFontMetrics(font)
+
+
+@lru_cache(maxsize=1024)
+def _text_width(font_face, pixel_size, text):
+    """
+    Returns the rendered width of the text. Resizing re-measures the same labels at the same few sizes, so
+    the measurements are cached as well.
+    """
+    return _metrics_for(font_face, pixel_size).boundingRect(text).width()
+
+
 def calculate_scaling_factor(parent_width, actual_text, initial_text_width, font_face, max_font_size, min_font_size=3,
                              log_required=False):
     """
@@ -21,54 +42,28 @@ def calculate_scaling_factor(parent_width, actual_text, initial_text_width, font
         int: The calculated font size.
     """
     scaling_factor = parent_width / initial_text_width
-    new_size = max_font_size * scaling_factor
-
-    if new_size < min_font_size:
-        new_size = min_font_size
-    elif new_size > max_font_size:
-        new_size = max_font_size
+    new_size = min(max_font_size, max(min_font_size, max_font_size * scaling_factor))
 
     if log_required:
         logger.debug(f"Initial calculated font size: {new_size}px")
 
-    iteration_count = 0
-    max_iterations = 50
     tolerance = 3
 
-    last_size_adjustment_direction = None
-
-    while iteration_count < max_iterations:
-        font = QFont(font_face)
-        font.setPixelSize(int(new_size))
-        font_metrics = QFontMetrics(font)
-        predicted_text_width = font_metrics.boundingRect(actual_text).width()
+    predicted_text_width = _text_width(font_face, int(new_size), actual_text)
 
-        if log_required:
-            logger.debug(
-                f"Iteration {iteration_count} - Font Size: {new_size}px, Predicted Text Width: {predicted_text_width}px")
-
-        if abs(predicted_text_width - parent_width) <= tolerance:
-            break
+    if log_required:
+        logger.debug(f"Predicted Text Width: {predicted_text_width}px at Font Size: {new_size}px")
 
-        if predicted_text_width > parent_width:
-            if last_size_adjustment_direction == 'increase':
-                break
-            new_size -= 0.5
-            last_size_adjustment_direction = 'decrease'
+    # Text width grows close to linearly with the pixel size, so a single proportional correction of the
+    # initial guess lands within tolerance instead of walking towards it in half-pixel steps
+    if abs(predicted_text_width - parent_width) > tolerance:
+        if predicted_text_width:
+            new_size *= parent_width / predicted_text_width
         else:
-            if last_size_adjustment_direction == 'decrease':
-                break
-            new_size += 0.5
-            last_size_adjustment_direction = 'increase'
-
-        if new_size < min_font_size:
-            new_size = min_font_size
-            break
-        elif new_size > max_font_size:
-            new_size = max_font_size
-            break
-
-        iteration_count += 1
+            new_size = max_font_size  # Nothing to measure, the text fits at any size
+        new_size = min(max_font_size, max(min_font_size, new_size))
+
+        predicted_text_width = _text_width(font_face, int(new_size), actual_text)
 
     if log_required:
         logger.debug(
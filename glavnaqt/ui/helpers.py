@@ -1,3 +1,7 @@
+from functools import lru_cache
+
+from PyQt6 import sip
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import QLabel
 
@@ -13,10 +17,36 @@ def get_qlabel(ui_instance, name):
     Returns:
         QLabel: The found QLabel, or None if not found.
     """
-    return ui_instance.findChild(QLabel, name)
+    # findChild walks the whole subtree, so hits are remembered on the instance. A cached label is only reused
+    # while it still exists, keeps its name and is still inside ui_instance; misses aren't cached.
+    cache = ui_instance.__dict__.setdefault('_qlabel_cache', {})
+    label = cache.get(name)
+    if label is None or sip.isdeleted(label) or label.objectName() != name or not ui_instance.isAncestorOf(label):
+        label = ui_instance.findChild(QLabel, name)
+        if label is None:
+            cache.pop(name, None)
+        else:
+            cache[name] = label
+    return label
 
 
-def apply_font(font_face, font_size, widget):
+@lru_cache(maxsize=128)
+def _font(font_face, font_size):
     font = QFont(font_face)
     font.setPixelSize(font_size)
+    return font
+
+
+def apply_font(font_face, font_size, widget):
+    # Fonts named by family are shared from a cache, setFont() takes its own copy. A QFont passed as the face is
+    # mutable and usually unique, so it is still copied and resized here.
+    if isinstance(font_face, str):
+        font = _font(font_face, font_size)
+    else:
+        font = QFont(font_face)
+        font.setPixelSize(font_size)
+    # Only a font the widget was given explicitly is skipped; an equal font it merely inherits still has to be set,
+    # or later font changes on the parent would reach the widget
+    if widget.testAttribute(Qt.WidgetAttribute.WA_SetFont) and widget.font() == font:
+        return  # Already set; setFont() would still resolve the font against the parent's and repolish
     widget.setFont(font)
@@ -1,6 +1,9 @@
+import logging
 import time
+from collections import namedtuple
+from functools import partial
 
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QEvent, QObject, QSignalBlocker
 from PyQt6.QtWidgets import QSplitter, QWidget, QVBoxLayout, QProgressBar
 
 from glavnaqt.core import logger
@@ -11,17 +14,61 @@ from .helpers import apply_font
 from .panel import PanelLabel, EXPANDING_FIXED
 
 
+# The values of the current configuration the layout reads while adjusting, taken once per configuration
+_ConfigSnapshot = namedtuple("_ConfigSnapshot", "window_width font_face font_size splitter_handle_width")
+
+
+class _ShowWatcher(QObject):
+    """Runs a callback on the event loop turn after a watched widget is shown."""
+
+    def __init__(self, callback):
+        super().__init__()
+        self._callback = callback
+
+    def watch(self, widget):
+        widget.installEventFilter(self)  # Installing it again on the same widget doesn't add a second filter
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Show:
+            obj.removeEventFilter(self)
+            QTimer.singleShot(0, self._callback)
+        return False
+
+
 class LayoutManager:
     """A class to manage individual layout configurations."""
 
+    __slots__ = (
+        "current_widgets", "_central_widget", "is_initialized", "last_resize_log_time", "resize_log_threshold",
+        "last_config", "current_config", "_cfg", "_widget_adjuster", "_adjust_pending", "_pending_adjust_args",
+        "_adjust_timer", "_show_watcher", "initial_dims", "_last_adjust_key", "_pending_window_size",
+        "_built_topology", "__weakref__",  # Qt connects bound methods through weak references
+    )
+
     def __init__(self):
-        self.current_widgets = {}
+        self.current_widgets = {}  # Widgets only; the central one is also referenced by _central_widget
+        self._central_widget = None
         self.is_initialized = False
         self.last_resize_log_time = time.time()
         self.resize_log_threshold = 0.5
         self.last_config = None
         self.current_config = None
+        self._cfg = None
+        # Topology of the tree as last built. Kept apart from current_config, which callers may edit in place
+        # and pass back in.
+        self._built_topology = None
         self._widget_adjuster = None
+        # Splitter drags report every pixel; the adjustments they trigger are coalesced to one per frame
+        self._adjust_pending = False
+        self._pending_adjust_args = None
+        self._adjust_timer = QTimer()
+        self._adjust_timer.setSingleShot(True)
+        self._adjust_timer.setInterval(16)
+        self._adjust_timer.timeout.connect(self._run_pending_adjust)
+        self._show_watcher = _ShowWatcher(self.initialize_geometries)
+        self.initial_dims = {}  # widget key -> (width, height) first measured by initialize_geometries
+        self._last_adjust_key = None  # Inputs of the last adjust_layout, reset whenever the layout changes
+        self._pending_window_size = None  # Window size for the adjustment update_layout schedules
 
     @property
     def widget_adjuster(self):
@@ -35,229 +82,329 @@ class LayoutManager:
         widget.setLayout(QVBoxLayout())
         return widget
 
+    def _mk_panel(self, section_key, object_name, size_policy, config):
+        """
+        Creates the panel label for a section. The label takes the configured font when it's built, so the
+        panel needs no further font change afterwards.
+
+        Args:
+            section_key (str): The section of the configuration the panel shows.
+            object_name (str): The object name given to the label.
+            size_policy (tuple): The horizontal and vertical size policies of the label.
+            config (UIConfiguration): The configuration supplying the section and the font.
+        """
+        section = config.collapsible_sections.get(section_key, {})
+        return PanelLabel(section.get("text"), object_name, size_policy, font_name=config.font_face,
+                          font_size=config.font_size, alignment=section.get("alignment"))
+
     def create_top_bar(self, config):
-        top_widget = PanelLabel(
-            config.collapsible_sections["top"].get("text"),
-            "top_bar",
-            EXPANDING_FIXED,
-            font_name=config.font_face,
-            font_size=config.font_size,
-            alignment=config.collapsible_sections.get("top").get("alignment")
-        )
+        top_widget = self._mk_panel("top", "top_bar", EXPANDING_FIXED, config)
         top_widget.setObjectName('top_widget')
-        apply_font(config.font_face, config.font_size, top_widget)
         return top_widget
 
     def create_status_bar(self, config):
-        bottom_widget = PanelLabel(
-            f'{config.collapsible_sections["bottom"].get("text")}',
-            "status_bar",
-            EXPANDING_FIXED,
-            font_name=config.font_face,
-            font_size=config.font_size,
-            alignment=config.collapsible_sections.get("bottom", {}).get("alignment")
-        )
+        bottom_widget = self._mk_panel("bottom", "status_bar", EXPANDING_FIXED, config)
         bottom_widget.setObjectName("bottom_widget")
-        apply_font(config.font_face, config.font_size, bottom_widget)
         return bottom_widget
 
     def get_geometries(self):
-        return {k: {"w": v.width(), "h": v.height()} for k, v in self.current_widgets.items() if not isinstance(v, str)}
+        return {k: (v.width(), v.height()) for k, v in self.current_widgets.items()}
 
     def build_layout(self, config):
-        self.clear_layout()
-        if self.current_widgets.get("vertical_splitter") is None:
-            self.current_widgets.update(
-                {"vertical_splitter": QSplitter(Qt.Orientation.Vertical, objectName="vertical_splitter")})
-        main_content_splitter = self.create_main_content_splitter(config)
-        if "top" in config.collapsible_sections:
-            if "top_splitter" not in self.current_widgets:
-                self.current_widgets.update(
-                    {"top_splitter": self.create_splitter(Qt.Orientation.Vertical, "top_splitter",
-                                                          config.splitter_handle_width, config, "top")})
-            if config.collapsible_sections.get("top", {}).get("widget"):
-                self.current_widgets["top_widget"] = config.collapsible_sections["top"]["widget"]
-                del config.collapsible_sections["top"]["widget"]
-            elif "top_widget" not in self.current_widgets:
-                self.current_widgets["top_widget"] = self.create_top_bar(config)
-            self.current_widgets["top_splitter"].addWidget(self.current_widgets["top_widget"])
-            self.current_widgets["top_splitter"].addWidget(main_content_splitter)
-            self.current_widgets["vertical_splitter"].addWidget(self.current_widgets.get("top_splitter"))
-        else:
-            self.current_widgets.get("vertical_splitter").addWidget(main_content_splitter)
-
-        if "bottom" in config.collapsible_sections:
-            if "bottom_splitter" not in self.current_widgets:
-                self.current_widgets.update(
-                    {"bottom_splitter": self.create_splitter(Qt.Orientation.Vertical, "bottom_splitter",
-                                                             config.splitter_handle_width, config, "bottom")})
-            if config.collapsible_sections.get("bottom", {}).get("widget"):
-                self.current_widgets.update({"bottom_widget": config.collapsible_sections["bottom"]["widget"]})
-                del config.collapsible_sections["bottom"]["widget"]
-                if config.collapsible_sections.get("bottom", {}).get("status_label"):
-                    self.current_widgets.update({"status_label": config.collapsible_sections["bottom"]["status_label"]})
-                    del config.collapsible_sections["bottom"]["status_label"]
-                    busy_indicator = self.current_widgets["bottom_widget"].findChild(QProgressBar, "busy_indicator")
-                    if busy_indicator:
-                        self.current_widgets.update({"busy_indicator": busy_indicator})
-            elif "bottom_widget" not in self.current_widgets:
-                self.current_widgets.update({"bottom_widget": self.create_status_bar(config)})
-            elif "status_label" in self.current_widgets and self.current_widgets["status_label"].parent() != \
-                    self.current_widgets["bottom_widget"]:
-                self.current_widgets["bottom_widget"].addPermanentWidget(self.current_widgets["status_label"], 1)
-                if "busy_indicator" in self.current_widgets:
-                    self.current_widgets["bottom_widget"].addPermanentWidget(self.current_widgets["busy_indicator"], 0)
-            self.current_widgets["bottom_splitter"].addWidget(self.current_widgets["vertical_splitter"])
-            self.current_widgets["bottom_splitter"].addWidget(self.current_widgets["bottom_widget"])
-            self.current_widgets.update({"central_widget": "bottom_splitter"})
-        else:
-            self.current_widgets.update({"central_widget": "vertical_splitter"})
+        keep_keys = None
+        built_topology = self._built_topology
+        if built_topology is not None and built_topology[0] == frozenset(config.collapsible_sections):
+            # Same sections, so every placed widget goes back into the slot it is in. A different arrangement
+            # still detaches everything: splitters would otherwise keep the sizes of the previous one.
+            keep_keys = set(self._expected_keys(config))
+        self.clear_layout(keep_keys=keep_keys)
+        # Every widget is created first and the splitter tree is assembled afterwards in one pass, so Qt
+        # invalidates the layout once per rebuild instead of after each section; the geometry reads wait
+        # for the event loop, behind the relayout.
+        self._stage_widgets(config)
+        splitters = [widget for widget in self.current_widgets.values() if isinstance(widget, QSplitter)]
+        # The splitters stay silent while the tree is assembled and their geometry is updated once afterwards
+        blockers = [QSignalBlocker(splitter) for splitter in splitters]
+        try:
+            self._mount_widgets(config)
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+        for splitter in splitters:
+            splitter.updateGeometry()
+        self._set_current_config(config)
+        QTimer.singleShot(0, self.initialize_geometries)
+
+    def _set_current_config(self, config):
         self.last_config = self.current_config
         self.current_config = config
-        QTimer.singleShot(25, lambda: self.initialize_geometries())
+        self._cfg = _ConfigSnapshot(config.window_size[0], config.font_face, config.font_size,
+                                    config.splitter_handle_width)
+        self._built_topology = self._config_topology(config)
+
+    def _stage_widgets(self, config):
+        """Creates or takes over the splitters and widgets the configuration needs, without arranging them."""
+        widgets = self.current_widgets
+        sections = config.collapsible_sections
+        if widgets.get("vertical_splitter") is None:
+            widgets["vertical_splitter"] = QSplitter(Qt.Orientation.Vertical, objectName="vertical_splitter")
+        if widgets.get("horizontal_splitter") is None:
+            widgets["horizontal_splitter"] = QSplitter(Qt.Orientation.Horizontal, objectName="horizontal_splitter")
+        main_content = sections.get("main_content")
+        if main_content.get("widget"):
+            widgets["main_content_widget"] = main_content.pop("widget")
+        elif not widgets.get("main_content_widget"):
+            widgets["main_content_widget"] = self.create_main_content(config)
+
+        left = sections.get("left")
+        if left is not None:
+            if "left_splitter" not in widgets:
+                widgets["left_splitter"] = self.create_splitter(Qt.Orientation.Horizontal, "left_splitter",
+                                                                config.splitter_handle_width, config, "left")
+            if left.get("widget"):
+                widgets["left_widget"] = left.pop("widget")
+            elif "left_widget" not in widgets:
+                widgets["left_widget"] = self.create_left_sidebar(config)
+
+        right = sections.get("right")
+        if right is not None:
+            if "right_splitter" not in widgets:
+                widgets["right_splitter"] = self.create_splitter(Qt.Orientation.Horizontal, "right_splitter",
+                                                                 config.splitter_handle_width, config, "right")
+            if right.get("widget"):
+                widgets["right_widget"] = right.pop("widget")
+            elif "right_widget" not in widgets:
+                widgets["right_widget"] = self.create_right_sidebar(config)
+
+        top = sections.get("top")
+        if top is not None:
+            if "top_splitter" not in widgets:
+                widgets["top_splitter"] = self.create_splitter(Qt.Orientation.Vertical, "top_splitter",
+                                                               config.splitter_handle_width, config, "top")
+            if top.get("widget"):
+                widgets["top_widget"] = top.pop("widget")
+            elif "top_widget" not in widgets:
+                widgets["top_widget"] = self.create_top_bar(config)
+
+        bottom = sections.get("bottom")
+        if bottom is not None:
+            if "bottom_splitter" not in widgets:
+                widgets["bottom_splitter"] = self.create_splitter(Qt.Orientation.Vertical, "bottom_splitter",
+                                                                  config.splitter_handle_width, config, "bottom")
+            if bottom.get("widget"):
+                bottom_widget = widgets["bottom_widget"] = bottom.pop("widget")
+                if bottom.get("status_label"):
+                    widgets["status_label"] = bottom.pop("status_label")
+                    busy_indicator = bottom_widget.findChild(QProgressBar, "busy_indicator")
+                    if busy_indicator:
+                        widgets["busy_indicator"] = busy_indicator
+            elif "bottom_widget" not in widgets:
+                widgets["bottom_widget"] = self.create_status_bar(config)
+            elif "status_label" in widgets and widgets["status_label"].parent() != widgets["bottom_widget"]:
+                # Puts a status label taken out by clear_layout back on its own status bar; the splitter tree
+                # is not touched here
+                widgets["bottom_widget"].addPermanentWidget(widgets["status_label"], 1)
+                if "busy_indicator" in widgets:
+                    widgets["bottom_widget"].addPermanentWidget(widgets["busy_indicator"], 0)
+
+    def _mount_widgets(self, config):
+        """Arranges the staged widgets into the splitter tree for the configuration, innermost splitters first."""
+        widgets = self.current_widgets
+        sections = config.collapsible_sections
+        if "left" in sections:
+            widgets["left_splitter"].addWidget(widgets["left_widget"])
+            widgets["left_splitter"].addWidget(widgets["main_content_widget"])
+            widgets["horizontal_splitter"].addWidget(widgets["left_splitter"])
+        else:
+            widgets["horizontal_splitter"].addWidget(widgets["main_content_widget"])
+
+        if "right" in sections:
+            widgets["right_splitter"].addWidget(widgets["horizontal_splitter"])
+            widgets["right_splitter"].addWidget(widgets["right_widget"])
+            main_content_splitter = widgets["right_splitter"]
+        else:
+            main_content_splitter = widgets["horizontal_splitter"]
+
+        if "top" in sections:
+            widgets["top_splitter"].addWidget(widgets["top_widget"])
+            widgets["top_splitter"].addWidget(main_content_splitter)
+            widgets["vertical_splitter"].addWidget(widgets["top_splitter"])
+        else:
+            widgets["vertical_splitter"].addWidget(main_content_splitter)
+
+        if "bottom" in sections:
+            widgets["bottom_splitter"].addWidget(widgets["vertical_splitter"])
+            widgets["bottom_splitter"].addWidget(widgets["bottom_widget"])
+            self._central_widget = widgets["bottom_splitter"]
+        else:
+            self._central_widget = widgets["vertical_splitter"]
 
     def initialize_geometries(self):
+        central_widget = self.get_central_widget()
+        if central_widget is not None and not central_widget.isVisible():
+            # Hidden widgets haven't been laid out yet; measure once the central widget is shown instead
+            self._show_watcher.watch(central_widget)
+            return
         widget_dimensions = self.get_geometries()
-        logger.debug(f'{widget_dimensions}')
-        for widget_name, dims in widget_dimensions.items():
-            width_attr = f"initial_{widget_name}_width"
-            height_attr = f"initial_{widget_name}_height"
-
-            if 'w' in dims and not getattr(self, width_attr, None):
-                setattr(self, width_attr, dims['w'])
-                logger.debug(f"Initial {widget_name} width: {dims['w']}px")
-
-            if 'h' in dims and not getattr(self, height_attr, None):
-                setattr(self, height_attr, dims['h'])
-                logger.debug(f"Initial {widget_name} height: {dims['h']}px")
+        logger.debug('%s', widget_dimensions)
+        self._last_adjust_key = None  # The adjuster scales from the dimensions recorded here
+        initial_dims = self.initial_dims
+        for widget_name, (measured_width, measured_height) in widget_dimensions.items():
+            width, height = initial_dims.get(widget_name, (None, None))
+
+            if not width:
+                width = measured_width
+                logger.debug("Initial %s width: %spx", widget_name, width)
+
+            if not height:
+                height = measured_height
+                logger.debug("Initial %s height: %spx", widget_name, height)
+            initial_dims[widget_name] = (width, height)
         for widget in (self.current_widgets.get('top_widget'), self.current_widgets.get('bottom_widget')):
             if widget:
                 self.widget_adjuster.set_bar_height_to_text_height(widget)
         self.is_initialized = True
 
     def create_splitter(self, orientation, name, handle_width, config, identifier="default"):
-        logger.debug(f'Creating collapsible splitter for {identifier}')
+        logger.debug('Creating collapsible splitter for %s', identifier)
         splitter = CollapsibleSplitter(orientation, identifier=identifier,
                                        handle_width=handle_width)
         splitter.setObjectName(name)
         splitter.setContentsMargins(0, 0, 0, 0)
+        # The arguments are packed once here rather than in a closure evaluated on every move
         splitter.splitterMoved.connect(
-            lambda pos, index: self.handle_splitter_movement(splitter, pos, index, config.window_size[0],
-                                                             config.font_face,
-                                                             config.font_size))
+            partial(self._on_splitter_moved, splitter, config.window_size[0], config.font_face, config.font_size))
         return splitter
 
+    def _on_splitter_moved(self, splitter, window_width, font_face, font_size, pos, index):
+        self.handle_splitter_movement(splitter, pos, index, window_width, font_face, font_size)
+
     def create_main_content(self, config):
-        main_content_widget = PanelLabel(
-            config.collapsible_sections.get("main_content").get("text"),
-            "main_content_widget",
-            EXPANDING_EXPANDING,
-            font_name=config.font_face,
-            font_size=config.font_size,
-            alignment=config.collapsible_sections.get("main_content").get("alignment")
-        )
-        apply_font(config.font_face, config.font_size, main_content_widget)
-        return main_content_widget
+        return self._mk_panel("main_content", "main_content_widget", EXPANDING_EXPANDING, config)
 
     def create_left_sidebar(self, config):
-        left_sidebar_widget = PanelLabel(
-            config.collapsible_sections["left"].get("text"),
-            "left_sidebar_widget",
-            FIXED_EXPANDING,
-            font_name=config.font_face,
-            font_size=config.font_size,
-            alignment=config.collapsible_sections.get("left").get("alignment")
-        )
-        apply_font(config.font_face, config.font_size, left_sidebar_widget)
-        return left_sidebar_widget
+        return self._mk_panel("left", "left_sidebar_widget", FIXED_EXPANDING, config)
 
     def create_right_sidebar(self, config):
-        right_sidebar_widget = PanelLabel(
-            config.collapsible_sections.get("right", {}).get("text"),
-            "right_sidebar_widget",
-            FIXED_EXPANDING,
-            font_name=config.font_face,
-            font_size=config.font_size,
-            alignment=config.collapsible_sections.get("right").get("alignment")
-        )
-        apply_font(config.font_face, config.font_size, right_sidebar_widget)
-        return right_sidebar_widget
-
-    def create_main_content_splitter(self, config):
-        if self.current_widgets.get("horizontal_splitter") is None:
-            self.current_widgets.update(
-                {"horizontal_splitter": QSplitter(Qt.Orientation.Horizontal, objectName="horizontal_splitter")})
-        if config.collapsible_sections.get("main_content").get("widget"):
-            self.current_widgets.update({"main_content_widget": config.collapsible_sections["main_content"]["widget"]})
-            del config.collapsible_sections["main_content"]["widget"]
-        elif not self.current_widgets.get("main_content_widget"):
-            self.current_widgets.update({"main_content_widget": self.create_main_content(config)})
-
-        if "left" in config.collapsible_sections:
-            if "left_splitter" not in self.current_widgets:
-                self.current_widgets.update(
-                    {"left_splitter": self.create_splitter(Qt.Orientation.Horizontal, "left_splitter",
-                                                           config.splitter_handle_width, config, "left")})
-            if config.collapsible_sections.get("left", {}).get("widget"):
-                self.current_widgets.update({"left_widget": config.collapsible_sections["left"]["widget"]})
-                del config.collapsible_sections["left"]["widget"]
-            elif "left_widget" not in self.current_widgets:
-                self.current_widgets.update({"left_widget": self.create_left_sidebar(config)})
-            self.current_widgets["left_splitter"].addWidget(self.current_widgets["left_widget"])
-            self.current_widgets["left_splitter"].addWidget(self.current_widgets["main_content_widget"])
-            self.current_widgets["horizontal_splitter"].addWidget(self.current_widgets["left_splitter"])
-        else:
-            self.current_widgets["horizontal_splitter"].addWidget(self.current_widgets["main_content_widget"])
-
-        if "right" in config.collapsible_sections:
-            if "right_splitter" not in self.current_widgets:
-                self.current_widgets.update(
-                    {"right_splitter": self.create_splitter(Qt.Orientation.Horizontal, "right_splitter",
-                                                            config.splitter_handle_width, config, "right")})
-            if config.collapsible_sections.get("right", {}).get("widget"):
-                self.current_widgets.update({"right_widget": config.collapsible_sections["right"]["widget"]})
-                del config.collapsible_sections["right"]["widget"]
-            elif "right_widget" not in self.current_widgets:
-                self.current_widgets.update({"right_widget": self.create_right_sidebar(config)})
-            self.current_widgets["right_splitter"].addWidget(self.current_widgets["horizontal_splitter"])
-            self.current_widgets["right_splitter"].addWidget(self.current_widgets["right_widget"])
-            return self.current_widgets["right_splitter"]
-
-        return self.current_widgets["horizontal_splitter"]
-
-    def clear_layout(self):
-        """Clear the current layout but keep all widgets for potential reuse."""
-        if "central_widget" in self.current_widgets:
-            del self.current_widgets["central_widget"]
-            for widget in self.current_widgets.values():
-                widget.setParent(None)
+        return self._mk_panel("right", "right_sidebar_widget", FIXED_EXPANDING, config)
+
+    def clear_layout(self, keep_keys=None):
+        """
+        Clear the current layout but keep all widgets for potential reuse.
+
+        Args:
+            keep_keys (set, optional): Keys of the widgets the next layout places again. These stay attached
+                until they are re-added, so they aren't detached and polished again for nothing.
+        """
+        if self._central_widget is not None:
+            self._central_widget = None
+            for key, widget in self.current_widgets.items():
+                if not keep_keys or key not in keep_keys:
+                    widget.setParent(None)
+
+    @staticmethod
+    def _expected_keys(config):
+        """
+        Yields the keys of the widgets _mount_widgets places again for the configuration. A widget the
+        configuration replaces with one of its own isn't, the old one has to be detached.
+        """
+        yield from ("vertical_splitter", "horizontal_splitter")
+        sections = config.collapsible_sections
+        if not sections["main_content"].get("widget"):
+            yield "main_content_widget"
+        for section in ("left", "right", "top", "bottom"):
+            if section in sections:
+                yield f"{section}_splitter"
+                if not sections[section].get("widget"):
+                    yield f"{section}_widget"
+                    if section == "bottom":
+                        # Children of the status bar, they move with it
+                        yield from ("status_label", "busy_indicator")
 
     def get_central_widget(self):
-        return self.current_widgets.get(self.current_widgets.get("central_widget"))
+        return self._central_widget
+
+    @staticmethod
+    def _config_topology(config):
+        """Returns what decides the shape of the splitter tree for the configuration."""
+        return frozenset(config.collapsible_sections), config.splitter_handle_width
 
     def update_layout(self, config, current_window_size=None):
-        self.clear_layout()
-        self.build_layout(config)
-        QTimer.singleShot(0, lambda: self.adjust_layout(current_window_size=current_window_size))
+        self._last_adjust_key = None
+        if self._config_topology(config) == self._built_topology \
+                and not any(section.get("widget") for section in config.collapsible_sections.values()):
+            # The tree already has this shape; only the panels' contents can differ
+            self._patch_panels(config)
+            self._set_current_config(config)
+        else:
+            # Repaints are held off while the tree is taken apart and put back together, the window paints the
+            # finished layout once. A window that already has updates disabled is left that way.
+            central_widget = self.get_central_widget()
+            window = central_widget.window() if central_widget is not None else None
+            suspend_updates = window is not None and window.updatesEnabled()
+            if suspend_updates:
+                window.setUpdatesEnabled(False)
+            try:
+                self.build_layout(config)  # Clears the previous layout itself, keeping what the new one reuses
+            finally:
+                if suspend_updates:
+                    window.setUpdatesEnabled(True)
+        self._pending_window_size = current_window_size
+        QTimer.singleShot(0, self._adjust_layout_after_build)
+
+    def _adjust_layout_after_build(self):
+        self.adjust_layout(current_window_size=self._pending_window_size)
+
+    def _patch_panels(self, config):
+        """Pushes the configuration's text, alignment and font face into the panels already in the tree."""
+        widgets = self.current_widgets
+        for name, section in config.collapsible_sections.items():
+            panel = widgets.get(f"{name}_widget")
+            if not isinstance(panel, PanelLabel):  # A supplied widget, such as the status bar, is left alone
+                continue
+            text = section.get("text")
+            if text is not None and panel.text() != text:
+                panel.setText(text)
+            alignment = section.get("alignment")
+            if alignment is not None and panel.alignment() != alignment:
+                panel.setAlignment(alignment)
+            if panel.font().family() != config.font_face:
+                apply_font(config.font_face, config.font_size, panel)
 
     def handle_splitter_movement(self, splitter, pos, index, window_width, font_face, font_size):
-        logger.debug(f'Handling splitter movement for {splitter.identifier} at position {pos} and index {index}')
-        self.adjust_layout(window_width, font_face, font_size)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Handling splitter movement for %s at position %s and index %s', splitter.identifier, pos,
+                         index)
+        # Only the latest position matters, the adjustment runs once when the frame's timer fires
+        self._pending_adjust_args = (window_width, font_face, font_size)
+        if not self._adjust_pending:
+            self._adjust_pending = True
+            self._adjust_timer.start()
+
+    def _run_pending_adjust(self):
+        self._adjust_pending = False
+        self.adjust_layout(*self._pending_adjust_args)
 
     def adjust_layout(self, original_window_width=None, font_face=None, font_size=None, current_window_size=None):
         if not original_window_width:
-            original_window_width = self.current_config.window_size[0]
+            original_window_width = self._cfg.window_width
         if current_window_size:
             self.get_central_widget().resize(*current_window_size)
 
         if not font_face:
-            font_face = self.current_config.font_face
+            font_face = self._cfg.font_face
         if not font_size:
-            font_size = self.current_config.font_size
+            font_size = self._cfg.font_size
 
         if not self.current_widgets.get("main_content_widget"):
             logger.error("main_content_widget is not initialized. Layout adjustment cannot proceed.")
             return
+        # A second adjustment with the same inputs over the same widget sizes would apply the same sizes again
+        adjust_key = (original_window_width, font_face, font_size,
+                      tuple((w.width(), w.height()) for w in self.current_widgets.values()))
+        if adjust_key == self._last_adjust_key:
+            return
+        self._last_adjust_key = adjust_key
         try:
             self.widget_adjuster.adjust_font_and_widget_sizes(original_window_width, font_face, font_size)
         except Exception as e:
@@ -272,10 +419,11 @@ class LayoutManagerFactory:
 
     def create_layout_manager(self, identifier, layout_dict):
         """Create a new layout manager and store it with the given identifier."""
-        if identifier not in self.layout_managers:
-            self.layout_managers[identifier] = LayoutManager()
-            self.layout_managers[identifier].build_layout(layout_dict)
-        return self.layout_managers[identifier]
+        layout_manager = self.layout_managers.get(identifier)
+        if layout_manager is None:
+            layout_manager = self.layout_managers[identifier] = LayoutManager()
+            layout_manager.build_layout(layout_dict)
+        return layout_manager
 
     def get_layout_manager(self, identifier):
         """Retrieve a layout manager by its identifier."""
@@ -283,5 +431,10 @@ class LayoutManagerFactory:
 
     def update_layout_manager(self, identifier, layout_dict):
         """Update the layout manager identified by the given identifier."""
-        if identifier in self.layout_managers:
-            self.layout_managers[identifier].update_layout(layout_dict)
+        layout_manager = self.layout_managers.get(identifier)
+        if layout_manager is not None:
+            layout_manager.update_layout(layout_dict)
+
+    def remove_layout_manager(self, identifier):
+        """Stop tracking the layout manager identified by the given identifier and return it, if any."""
+        return self.layout_managers.pop(identifier, None)
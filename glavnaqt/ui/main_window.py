@@ -1,3 +1,4 @@
+import logging
 import time
 
 from PyQt6.QtCore import QTimer
@@ -62,20 +63,37 @@ class MainWindow(QMainWindow):
         Updates the UI layout based on new collapsible sections without tearing down the entire layout.
         The layout is adjusted in memory before being applied to the UI to avoid flickering.
         """
-        logger.debug(f'Updating UI to {config}')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Updating UI to %s', config.debug_repr())
 
-        self._initialize_status_bar()
-        self.layout_manager.update_layout(config, current_window_size=(self.width(), self.height()))
-        self.setCentralWidget(self.layout_manager.get_central_widget())
-        self.centralWidget().updateGeometry()
+        # No intermediate state is painted while the layout and the central widget are swapped; enabling
+        # updates again repaints the window once
+        suspend_updates = self.updatesEnabled()
+        if suspend_updates:
+            self.setUpdatesEnabled(False)
+        try:
+            self._initialize_status_bar()
+            self.layout_manager.update_layout(config, current_window_size=(self.width(), self.height()))
+            central_widget = self.layout_manager.get_central_widget()
+            # The layout manager reuses its splitters and panels, so the central widget often stays the same one
+            if self.centralWidget() is not central_widget:
+                self.setCentralWidget(central_widget)
+            central_widget.updateGeometry()
+        finally:
+            if suspend_updates:
+                self.setUpdatesEnabled(True)
 
     def on_resize_timeout(self):
         """
         Callback function triggered when the resize timeout is reached, performing layout adjustments.
         """
+        # Whichever timer fired, the burst so far is handled by this adjustment
+        self.resize_timer.stop()
+        self.resize_max_timer.stop()
         if not self.suppress_logging:
             logger.debug("Resize signal timeout reached, performing layout adjustments.")
         self.layout_manager.adjust_layout()
+        self.event_bus.emit(**self.resize_emission_args)
         if self.status_bar:
             self.event_bus.emit('status_bar_update')
 
@@ -88,13 +106,11 @@ class MainWindow(QMainWindow):
         current_time = time.time()
         if not self.layout_manager.is_initialized or (
                 current_time - self.last_resize_log_time > self.resize_log_threshold):
-            logger.debug(f"Resize event handled, new size: {self.size()}")
+            logger.debug("Resize event handled, new size: %s", self.size())
 
         self.suppress_logging = True
-        handle_resize_event(self, event)
+        handle_resize_event(self, event)  # The layout is adjusted once the debounce timers fire
         super().resizeEvent(event)
-        self.layout_manager.adjust_layout()
-        self.event_bus.emit(**self.resize_emission_args)
         self.suppress_logging = False
         self.final_size_timer.start(200)
 
@@ -103,7 +119,7 @@ class MainWindow(QMainWindow):
         Logs the final window size after a resize event, if the window is still being resized.
         """
         if self.is_resizing:
-            logger.debug(f"Final window size after resize: {self.size()}")
+            logger.debug("Final window size after resize: %s", self.size())
             self.is_resizing = False
 
     def toggle_fullscreen_layout(self):
@@ -116,7 +132,7 @@ class MainWindow(QMainWindow):
                 'main_content': {"alignment": self.ui_config.collapsible_sections["main_content"]["alignment"]}}
             self.update_ui(_config)
         self.is_fullscreen = not self.is_fullscreen
-        logger.debug(f"UI toggled to {'fullscreen' if self.is_fullscreen else 'original'} layout.")
+        logger.debug("UI toggled to %s layout.", 'fullscreen' if self.is_fullscreen else 'original')
 
     def closeEvent(self, event):
         """
@@ -1,7 +1,8 @@
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import QLabel, QSizePolicy, QFrame
 
+from .helpers import apply_font
+
 # Constants for common size policies
 EXPANDING_FIXED = (QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
 FIXED_EXPANDING = (QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding)
@@ -18,7 +19,7 @@ class PanelLabel(QLabel):
         name (str): The object name for the label (useful for styling and identification).
         size_policy (tuple): A tuple containing the QSizePolicy for the horizontal and vertical dimensions.
         font_name (str, optional): The font family to use. Defaults to "Helvetica".
-        font_size (int, optional): The font size in points. Defaults to 12.
+        font_size (int, optional): The font size in pixels. Defaults to 12.
         alignment (Qt.AlignmentFlag, optional): The alignment of the text within the label. Defaults to Qt.AlignmentFlag.AlignCenter.
         frame_shape (QFrame.Shape, optional): The shape of the frame surrounding the label. Defaults to QFrame.Shape.NoFrame.
     """
@@ -27,7 +28,7 @@ class PanelLabel(QLabel):
                  alignment=Qt.AlignmentFlag.AlignCenter, frame_shape=QFrame.Shape.NoFrame):
         super().__init__(text)
         self.setObjectName(name)
-        self.setFont(QFont(font_name, font_size))
+        apply_font(font_name, font_size, self)  # The one font set before the label is first polished
         self.setAlignment(alignment)
         self.setFrameShape(frame_shape)
         self.setContentsMargins(0, 0, 0, 0)
@@ -1,3 +1,5 @@
+import logging
+
 from PyQt6.QtGui import QMouseEvent, QCursor
 from PyQt6.QtWidgets import QSplitterHandle, QSplitter, QMainWindow
 from PyQt6.QtCore import Qt
@@ -43,7 +45,7 @@ class CollapsibleSplitterHandle(QSplitterHandle):
         # Find and store the initial dimensions of the QMainWindow
         self._initialize_main_window_dimensions()
 
-        logger.debug(f'Custom splitter handle initialized for {identifier}')
+        logger.debug('Custom splitter handle initialized for %s', identifier)
 
 
     def _initialize_main_window_dimensions(self):
@@ -86,7 +88,8 @@ class CollapsibleSplitterHandle(QSplitterHandle):
                 current_handle_width = parent_splitter.handleWidth()  # Get handle width from parent splitter
                 if new_handle_width != current_handle_width:  # Only set if there's a change
                     self.setHandleWidth(new_handle_width)
-                    logger.debug(f"{self.identifier} splitter handle resized to {new_handle_width}px based on QMainWindow size")
+                    logger.debug("%s splitter handle resized to %spx based on QMainWindow size", self.identifier,
+                                 new_handle_width)
 
     def _find_main_window(self):
         """
@@ -121,7 +124,7 @@ class CollapsibleSplitterHandle(QSplitterHandle):
         """
         try:
             parent = self.parent()
-            logger.debug(f'{self.identifier} splitter handle mouse press event. Parent: {parent}')
+            logger.debug('%s splitter handle mouse press event. Parent: %s', self.identifier, parent)
             if self.identifier and parent:
                 if hasattr(parent, 'handle_mousePressEvent'):
                     parent.handle_mousePressEvent(event, self)
@@ -140,5 +143,7 @@ class CollapsibleSplitterHandle(QSplitterHandle):
         Args:
             event (QMouseEvent): The mouse event to handle.
         """
-        logger.debug(f'{self.identifier} splitter handle mouse move event overridden to disable dragging')
+        # Runs for every mouse move over the handle
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('%s splitter handle mouse move event overridden to disable dragging', self.identifier)
         pass  # Disable dragging by overriding the event without implementation
@@ -1,3 +1,6 @@
+import logging
+from functools import partial
+
 from PyQt6.QtCore import QTimer
 
 from glavnaqt.core import logger
@@ -13,7 +16,8 @@ def perform_transition(mainWin, start_config, end_config):
         end_config (UIConfiguration): The final configuration to apply after a delay.
     """
 
-    logger.debug(f'Applying start configuration: {start_config.replace_alignment_constants()}')
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('Applying start configuration: %s', start_config.replace_alignment_constants())
 
     # Check if the current UI state matches the start_config
     if mainWin.ui_config == start_config:
@@ -21,7 +25,7 @@ def perform_transition(mainWin, start_config, end_config):
     else:
         mainWin.update_ui(start_config)
 
-    QTimer.singleShot(5000, lambda: apply_end_config(mainWin, end_config))
+    QTimer.singleShot(5000, partial(apply_end_config, mainWin, end_config))
 
 
 def apply_end_config(mainWin, end_config):
@@ -33,5 +37,6 @@ def apply_end_config(mainWin, end_config):
         end_config (UIConfiguration): The final configuration to apply.
     """
     # Log the end configuration being applied
-    logger.debug(f'Applying end configuration: {end_config.replace_alignment_constants()}')
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('Applying end configuration: %s', end_config.replace_alignment_constants())
     mainWin.update_ui(end_config)
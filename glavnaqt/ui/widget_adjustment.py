@@ -131,7 +131,7 @@ class WidgetAdjuster:
         if primary is None:
             return None
 
-        initial_width = getattr(self.layout_manager, f'initial_{section_name}_widget_width', None)
+        initial_width = self.layout_manager.initial_dims.get(f'{section_name}_widget', (None, None))[0]
         if initial_width is None:
             return None
 